@@ -4,82 +4,257 @@ Movie Recommendation CLI
 A command-line application to get movie recommendations based on various criteria.
 """
 
-import requests
+import msgspec
 import sys
-from typing import List, Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, List, Dict, Optional, Tuple
+
+# (connect, read) timeouts in seconds for every TMDB request
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Keep-alive connections held open to TMDB; enough for the Show All fan-out
+MAX_CONNECTIONS = 8
+
+# How long cached TMDB responses stay fresh when TMDB sends no Cache-Control
+CACHE_EXPIRE_SECONDS = 24 * 60 * 60
+
+# Stay a little under TMDB's limit of roughly 40 requests per second
+REQUESTS_PER_SECOND = 35
+
+
+class Movie(msgspec.Struct):
+    """The fields of a TMDB movie result that we actually use."""
+    id: int
+    title: Optional[str] = None
+    release_date: Optional[str] = None
+    vote_average: float = 0
+    overview: Optional[str] = None
+    genre_ids: List[int] = []
+
+
+class MovieResults(msgspec.Struct):
+    """A page of movies from the search, discover or recommendations endpoints."""
+    results: List[Movie] = []
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing a steady number of calls per second."""
+    
+    def __init__(self, rate: float):
+        """Start with a full bucket of rate tokens."""
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take a token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative reserves a future slot, so concurrent callers queue up
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+# The HTTP stack is slow to import, so _ensure_http() fills these in on first use
+requests = None
+requests_cache = None
+sqlite3 = None
+Retry = None
+RateLimitedAdapter = None
+
+
+def _ensure_http():
+    """Import requests, requests-cache and urllib3, and define RateLimitedAdapter, once."""
+    global requests, requests_cache, sqlite3, Retry, RateLimitedAdapter
+    if RateLimitedAdapter is not None:
+        return
+    
+    import requests
+    import requests_cache
+    import sqlite3
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    class _RateLimitedAdapter(HTTPAdapter):
+        """HTTPAdapter that waits on a RateLimiter before each request hits the network."""
+        
+        def __init__(self, limiter: RateLimiter, **kwargs):
+            """Wrap HTTPAdapter, throttling its sends through limiter."""
+            self.limiter = limiter
+            super().__init__(**kwargs)
+        
+        def send(self, request, **kwargs):
+            """Send the request once the limiter allows it."""
+            self.limiter.acquire()
+            return super().send(request, **kwargs)
+    
+    RateLimitedAdapter = _RateLimitedAdapter
+
 
 class MovieRecommender:
     """Main class for movie recommendations using TMDB API."""
     
-    def __init__(self, api_key: str):
-        """Initialize with TMDB API key."""
+    def __init__(self, api_key: str, use_cache: bool = True):
+        """Initialize with TMDB API key, optionally caching responses on disk."""
         self.api_key = api_key
         self.base_url = "https://api.themoviedb.org/3"
         
-    def search_movie(self, title: str) -> Optional[Dict]:
-        """Search for a movie by title and return the best match."""
-        url = f"{self.base_url}/search/movie"
-        params = {
-            'api_key': self.api_key,
-            'query': title,
-            'language': 'en-US'
-        }
+        # Built once here rather than on every request
+        self._search_url = f"{self.base_url}/search/movie"
+        self._discover_url = f"{self.base_url}/discover/movie"
+        self._movie_url_tmpl = self.base_url + "/movie/{}"
+        self._recommendations_url_tmpl = self.base_url + "/movie/{}/recommendations"
+        self._default_params = {'api_key': api_key, 'language': 'en-US'}
+        self._discover_params = {'sort_by': 'popularity.desc'}
         
+        # The HTTP stack is slow to import, so it's loaded on first use
+        self.use_cache = use_cache
+        self._session = None
+        self._session_lock = threading.Lock()
+        
+        # TMDB data doesn't change during a session, so remember what we've fetched
+        self._search_cache: Dict[str, Optional[Movie]] = {}
+        self._details_cache: Dict[int, Dict] = {}
+        self._discover_cache: Dict[frozenset, List[Movie]] = {}
+        
+        # Import requests and open the TLS connection while the user is still typing a title
+        threading.Thread(target=self._warmup, daemon=True).start()
+        
+    @property
+    def session(self):
+        """The shared HTTP session, created on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+    
+    def _create_session(self):
+        """Import the HTTP stack and build the pooled, retrying, optionally cached session."""
+        _ensure_http()
+        
+        # One keep-alive session for every call, since they all hit the same host.
+        # The on-disk cache lives in the user cache directory, ignores api_key so
+        # entries are shared between keys, and falls back to stale data if TMDB
+        # is unreachable. If it can't be opened we carry on without it.
+        session = None
+        if self.use_cache:
+            try:
+                session = requests_cache.CachedSession(
+                    'tmdb_cache',
+                    backend='sqlite',
+                    use_cache_dir=True,
+                    expire_after=CACHE_EXPIRE_SECONDS,
+                    cache_control=True,
+                    allowable_methods=['GET'],
+                    stale_if_error=True,
+                    ignored_parameters=['api_key'],
+                )
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: could not open the response cache, continuing without it: {e}")
+        if session is None:
+            session = requests.Session()
+        # Retry transient failures, waiting as long as a 429's Retry-After asks
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+        # Every call goes to one host, so a single pool whose callers wait for a
+        # free connection rather than opening (and discarding) extra ones.
+        # Throttling happens here so responses served from the cache aren't delayed.
+        # urllib3 performs retries inside send(), so they aren't counted against the
+        # limiter; they are spaced out by the backoff and Retry-After instead.
+        adapter = RateLimitedAdapter(
+            RateLimiter(REQUESTS_PER_SECOND),
+            pool_connections=1,
+            pool_maxsize=MAX_CONNECTIONS,
+            pool_block=True,
+            max_retries=retries
+        )
+        session.mount('https://', adapter)
+        session.headers.update({'Accept-Encoding': 'gzip', 'Accept': 'application/json'})
+        return session
+    
+    def _warmup(self):
+        """Prime the connection pool with a live keep-alive connection to TMDB."""
+        # Best effort: any failure, including building the session, is raised
+        # again by the first real request on the main thread
         try:
-            response = requests.get(url, params=params)
+            self.session.head(f"{self.base_url}/configuration", params={'api_key': self.api_key}, timeout=5)
+        except Exception:
+            pass
+    
+    def _get(self, url: str, params: Dict, default, description: str, result_type: Any = Any):
+        """GET a TMDB endpoint and decode it, returning default if the request fails."""
+        session = self.session
+        try:
+            response = session.get(url, params=params | self._default_params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
-            
-            if data['results']:
-                return data['results'][0]  # Return the first (best) match
-            else:
+            # Typed decoding skips building dicts for fields we never read
+            return msgspec.json.decode(response.content, type=result_type)
+        except (requests.exceptions.RequestException, msgspec.DecodeError) as e:
+            print(f"Error {description}: {e}")
+            return default
+    
+    def search_movie(self, title: str) -> Optional[Movie]:
+        """Search for a movie by title and return the best match."""
+        cache_key = title.lower()
+        if cache_key not in self._search_cache:
+            data = self._get(self._search_url, {'query': title}, None, "searching for movie", MovieResults)
+            if data is None:
                 return None
-        except requests.exceptions.RequestException as e:
-            print(f"Error searching for movie: {e}")
-            return None
+            # Keep the first (best) match
+            self._search_cache[cache_key] = data.results[0] if data.results else None
+        return self._search_cache[cache_key]
     
     def get_movie_details(self, movie_id: int) -> Optional[Dict]:
         """Get detailed information about a movie."""
-        url = f"{self.base_url}/movie/{movie_id}"
-        params = {
-            'api_key': self.api_key,
-            'append_to_response': 'credits,keywords'
-        }
-        
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting movie details: {e}")
-            return None
+        if movie_id not in self._details_cache:
+            params = {'append_to_response': 'credits,keywords'}
+            details = self._get(self._movie_url_tmpl.format(movie_id), params, None, "getting movie details")
+            if details is None:
+                return None
+            self._details_cache[movie_id] = details
+        return self._details_cache[movie_id]
+    
+    def _top(self, results: List[Movie], limit: int, exclude_id: Optional[int] = None) -> List[Movie]:
+        """Take the first limit results, skipping exclude_id, without walking the whole page."""
+        matches = (movie for movie in results if movie.id != exclude_id)
+        return list(islice(matches, limit))
     
-    def get_recommendations_by_genre(self, movie_id: int, limit: int = 10) -> List[Dict]:
+    def _discover(self, params: Dict, description: str) -> Optional[List[Movie]]:
+        """Run a discover/movie query, reusing results for identical params."""
+        params = self._discover_params | params
+        cache_key = frozenset(params.items())
+        if cache_key not in self._discover_cache:
+            data = self._get(self._discover_url, params, None, description, MovieResults)
+            if data is None:
+                return None
+            self._discover_cache[cache_key] = data.results
+        return self._discover_cache[cache_key]
+    
+    def get_recommendations_by_genre(self, movie_id: int, limit: int = 10) -> List[Movie]:
         """Get movie recommendations based on genre."""
         movie_details = self.get_movie_details(movie_id)
         if not movie_details or 'genres' not in movie_details:
             return []
         
         genre_ids = [genre['id'] for genre in movie_details['genres']]
-        
-        url = f"{self.base_url}/discover/movie"
-        params = {
-            'api_key': self.api_key,
-            'with_genres': ','.join(map(str, genre_ids)),
-            'sort_by': 'popularity.desc',
-            'language': 'en-US'
-        }
-        
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            return data['results'][:limit]
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting genre recommendations: {e}")
-            return []
+        params = {'with_genres': ','.join(map(str, genre_ids))}
+        results = self._discover(params, "getting genre recommendations") or []
+        return self._top(results, limit)
     
-    def get_recommendations_by_director(self, movie_id: int, limit: int = 10) -> List[Dict]:
+    def get_recommendations_by_director(self, movie_id: int, limit: int = 10) -> List[Movie]:
         """Get movie recommendations based on director."""
         movie_details = self.get_movie_details(movie_id)
         if not movie_details or 'credits' not in movie_details:
@@ -96,25 +271,12 @@ class MovieRecommender:
             return []
         
         # Get other movies by this director
-        url = f"{self.base_url}/discover/movie"
-        params = {
-            'api_key': self.api_key,
-            'with_crew': director['id'],
-            'sort_by': 'popularity.desc',
-            'language': 'en-US'
-        }
-        
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            # Filter out the original movie
-            return [movie for movie in data['results'] if movie['id'] != movie_id][:limit]
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting director recommendations: {e}")
-            return []
+        params = {'with_crew': director['id']}
+        results = self._discover(params, "getting director recommendations") or []
+        # Filter out the original movie
+        return self._top(results, limit, exclude_id=movie_id)
     
-    def get_recommendations_by_cast(self, movie_id: int, limit: int = 10) -> List[Dict]:
+    def get_recommendations_by_cast(self, movie_id: int, limit: int = 10) -> List[Movie]:
         """Get movie recommendations based on cast members."""
         movie_details = self.get_movie_details(movie_id)
         if not movie_details or 'credits' not in movie_details:
@@ -126,26 +288,12 @@ class MovieRecommender:
             return []
         
         cast_ids = [actor['id'] for actor in cast]
-        
-        url = f"{self.base_url}/discover/movie"
-        params = {
-            'api_key': self.api_key,
-            'with_cast': ','.join(map(str, cast_ids)),
-            'sort_by': 'popularity.desc',
-            'language': 'en-US'
-        }
-        
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            # Filter out the original movie
-            return [movie for movie in data['results'] if movie['id'] != movie_id][:limit]
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting cast recommendations: {e}")
-            return []
+        params = {'with_cast': ','.join(map(str, cast_ids))}
+        results = self._discover(params, "getting cast recommendations") or []
+        # Filter out the original movie
+        return self._top(results, limit, exclude_id=movie_id)
     
-    def get_recommendations_by_keywords(self, movie_id: int, limit: int = 10) -> List[Dict]:
+    def get_recommendations_by_keywords(self, movie_id: int, limit: int = 10) -> List[Movie]:
         """Get movie recommendations based on plot keywords."""
         movie_details = self.get_movie_details(movie_id)
         if not movie_details or 'keywords' not in movie_details:
@@ -157,100 +305,134 @@ class MovieRecommender:
         
         # Use top 5 keywords
         keyword_ids = [kw['id'] for kw in keywords[:5]]
+        params = {'with_keywords': ','.join(map(str, keyword_ids))}
+        results = self._discover(params, "getting keyword recommendations") or []
+        # Filter out the original movie
+        return self._top(results, limit, exclude_id=movie_id)
+    
+    def get_recommendations_by_rating(self, movie_id: int, limit: int = 10) -> List[Movie]:
+        """Get movie recommendations based on similar ratings."""
+        movie_details = self.get_movie_details(movie_id)
+        if not movie_details:
+            return []
         
-        url = f"{self.base_url}/discover/movie"
+        rating = movie_details.get('vote_average', 0)
+        genre_ids = [genre['id'] for genre in movie_details.get('genres', [])]
         params = {
-            'api_key': self.api_key,
-            'with_keywords': ','.join(map(str, keyword_ids)),
-            'sort_by': 'popularity.desc',
-            'language': 'en-US'
+            'vote_average.gte': max(0, rating - 1),
+            'vote_average.lte': min(10, rating + 1),
+            'with_genres': ','.join(map(str, genre_ids)) if genre_ids else None
         }
-        
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            # Filter out the original movie
-            return [movie for movie in data['results'] if movie['id'] != movie_id][:limit]
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting keyword recommendations: {e}")
-            return []
+        results = self._discover(params, "getting rating recommendations") or []
+        # Filter out the original movie
+        return self._top(results, limit, exclude_id=movie_id)
     
-    def get_recommendations_by_rating(self, movie_id: int, limit: int = 10) -> List[Dict]:
-        """Get movie recommendations based on similar ratings."""
+    def get_combined_recommendations(self, movie_id: int, limit: int = 10) -> List[Movie]:
+        """Get movie recommendations matching genre, people, keywords and rating at once."""
         movie_details = self.get_movie_details(movie_id)
         if not movie_details:
             return []
         
         rating = movie_details.get('vote_average', 0)
-        genre_ids = [genre['id'] for genre in movie_details.get('genres', [])]
+        genre_ids = {genre['id'] for genre in movie_details.get('genres', [])}
+        credits = movie_details.get('credits', {})
+        directors = [member['id'] for member in credits.get('crew', []) if member['job'] == 'Director']
+        people_ids = directors[:1] + [actor['id'] for actor in credits.get('cast', [])[:3]]
+        keywords = movie_details.get('keywords', {}).get('keywords', [])
+        keyword_ids = [kw['id'] for kw in keywords[:5]]
         
-        url = f"{self.base_url}/discover/movie"
-        params = {
-            'api_key': self.api_key,
+        # TMDB ANDs separate filters together ('|' only ORs within one), so start
+        # with every criterion and drop the most specific ones if too few match
+        filters = {
             'vote_average.gte': max(0, rating - 1),
             'vote_average.lte': min(10, rating + 1),
-            'with_genres': ','.join(map(str, genre_ids)) if genre_ids else None,
-            'sort_by': 'popularity.desc',
-            'language': 'en-US'
         }
+        if genre_ids:
+            filters['with_genres'] = '|'.join(map(str, genre_ids))
+        if people_ids:
+            filters['with_people'] = '|'.join(map(str, people_ids))
+        if keyword_ids:
+            filters['with_keywords'] = '|'.join(map(str, keyword_ids))
+        relaxable = [key for key in ('with_keywords', 'with_people') if key in filters]
         
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            # Filter out the original movie
-            return [movie for movie in data['results'] if movie['id'] != movie_id][:limit]
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting rating recommendations: {e}")
-            return []
+        recommendations = []
+        seen = {movie_id}
+        while True:
+            results = self._discover(filters, "getting combined recommendations")
+            if results is None:
+                break
+            
+            # Movies from stricter queries match more criteria, so they rank first;
+            # within a query prefer more shared genres, then popularity
+            new_movies = [movie for movie in results if movie.id not in seen]
+            new_movies.sort(key=lambda movie: len(genre_ids.intersection(movie.genre_ids)), reverse=True)
+            recommendations.extend(new_movies)
+            seen.update(movie.id for movie in new_movies)
+            
+            if len(recommendations) >= limit or not relaxable:
+                break
+            del filters[relaxable.pop(0)]
+        
+        return self._top(recommendations, limit)
     
-    def get_tmdb_recommendations(self, movie_id: int, limit: int = 10) -> List[Dict]:
+    def get_tmdb_recommendations(self, movie_id: int, limit: int = 10) -> List[Movie]:
         """Get TMDB's built-in recommendations."""
-        url = f"{self.base_url}/movie/{movie_id}/recommendations"
-        params = {
-            'api_key': self.api_key,
-            'language': 'en-US'
-        }
+        url = self._recommendations_url_tmpl.format(movie_id)
+        data = self._get(url, {}, MovieResults(), "getting TMDB recommendations", MovieResults)
+        return self._top(data.results, limit)
+    
+    def get_all_recommendations(self, movie_id: int, limit: int = 5) -> List[Tuple[List[Movie], str]]:
+        """Get combined-criteria and TMDB recommendations, fetching them concurrently."""
+        criteria = [
+            (self.get_combined_recommendations, "All Criteria"),
+            (self.get_tmdb_recommendations, "TMDB Algorithm"),
+        ]
         
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            return data['results'][:limit]
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting TMDB recommendations: {e}")
-            return []
+        # Fetch the shared movie details once up front so the workers hit the cache
+        self.get_movie_details(movie_id)
+        
+        # The calls spend their time waiting on sockets, so threads overlap them
+        with ThreadPoolExecutor(max_workers=len(criteria)) as executor:
+            futures = [(executor.submit(fn, movie_id, limit), label) for fn, label in criteria]
+            return [(future.result(), label) for future, label in futures]
+    
+    @staticmethod
+    def _project(movie: Movie) -> Tuple[str, str, float, str]:
+        """Return the (title, year, rating, overview) shown for a movie."""
+        # TMDB occasionally sends nulls, so fall back here rather than in decoding
+        title = movie.title or 'Unknown'
+        year = (movie.release_date or '')[:4] or 'Unknown'
+        overview = movie.overview or 'No overview available.'
+        return title, year, movie.vote_average, overview
     
-    def display_movie_info(self, movie: Dict):
+    def display_movie_info(self, movie: Movie):
         """Display formatted movie information."""
-        title = movie.get('title', 'Unknown')
-        year = movie.get('release_date', 'Unknown')[:4] if movie.get('release_date') else 'Unknown'
-        rating = movie.get('vote_average', 0)
-        overview = movie.get('overview', 'No overview available.')
-        
-        print(f"\n{'='*80}")
-        print(f"Title: {title} ({year})")
-        print(f"Rating: {rating}/10")
-        print(f"Overview: {overview}")
-        print(f"{'='*80}")
+        title, year, rating, overview = self._project(movie)
+        # Write the block in one call rather than a print() per line
+        lines = [
+            f"\n{'='*80}",
+            f"Title: {title} ({year})",
+            f"Rating: {rating}/10",
+            f"Overview: {overview}",
+            f"{'='*80}",
+        ]
+        sys.stdout.write('\n'.join(lines) + '\n')
     
-    def display_recommendations(self, movies: List[Dict], criteria: str):
+    def display_recommendations(self, movies: List[Movie], criteria: str):
         """Display a list of recommended movies."""
         if not movies:
             print(f"\nNo recommendations found based on {criteria}.")
             return
         
-        print(f"\n\n{'#'*80}")
-        print(f"RECOMMENDATIONS BASED ON {criteria.upper()}")
-        print(f"{'#'*80}")
-        
+        lines = [
+            f"\n\n{'#'*80}",
+            f"RECOMMENDATIONS BASED ON {criteria.upper()}",
+            f"{'#'*80}",
+        ]
         for i, movie in enumerate(movies, 1):
-            title = movie.get('title', 'Unknown')
-            year = movie.get('release_date', 'Unknown')[:4] if movie.get('release_date') else 'Unknown'
-            rating = movie.get('vote_average', 0)
-            
-            print(f"\n{i}. {title} ({year}) - Rating: {rating}/10")
+            title, year, rating, _ = self._project(movie)
+            lines.append(f"\n{i}. {title} ({year}) - Rating: {rating}/10")
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def main():
@@ -266,7 +448,7 @@ def main():
         print("You can get a free API key at: https://www.themoviedb.org/settings/api")
         return
     
-    recommender = MovieRecommender(api_key)
+    recommender = MovieRecommender(api_key, use_cache='--no-cache' not in sys.argv[1:])
     
     # Get movie title from user
     movie_title = input("\nEnter a movie title: ").strip()
@@ -284,7 +466,17 @@ def main():
     
     # Display movie information
     recommender.display_movie_info(movie)
-    movie_id = movie['id']
+    movie_id = movie.id
+    
+    # Menu choices that fetch and display a single set of recommendations
+    handlers = {
+        '1': (recommender.get_recommendations_by_genre, "Genre"),
+        '2': (recommender.get_recommendations_by_director, "Director"),
+        '3': (recommender.get_recommendations_by_cast, "Cast"),
+        '4': (recommender.get_recommendations_by_keywords, "Plot Keywords"),
+        '5': (recommender.get_recommendations_by_rating, "Rating"),
+        '6': (recommender.get_tmdb_recommendations, "TMDB Algorithm"),
+    }
     
     # Show menu for recommendation criteria
     while True:
@@ -304,47 +496,16 @@ def main():
         
         choice = input("\nEnter your choice (1-9): ").strip()
         
-        if choice == '1':
-            recommendations = recommender.get_recommendations_by_genre(movie_id)
-            recommender.display_recommendations(recommendations, "Genre")
-        elif choice == '2':
-            recommendations = recommender.get_recommendations_by_director(movie_id)
-            recommender.display_recommendations(recommendations, "Director")
-        elif choice == '3':
-            recommendations = recommender.get_recommendations_by_cast(movie_id)
-            recommender.display_recommendations(recommendations, "Cast")
-        elif choice == '4':
-            recommendations = recommender.get_recommendations_by_keywords(movie_id)
-            recommender.display_recommendations(recommendations, "Plot Keywords")
-        elif choice == '5':
-            recommendations = recommender.get_recommendations_by_rating(movie_id)
-            recommender.display_recommendations(recommendations, "Rating")
-        elif choice == '6':
-            recommendations = recommender.get_tmdb_recommendations(movie_id)
-            recommender.display_recommendations(recommendations, "TMDB Algorithm")
+        if choice in handlers:
+            get_recommendations, criteria = handlers[choice]
+            recommender.display_recommendations(get_recommendations(movie_id), criteria)
         elif choice == '7':
             print("\n" + "#"*80)
             print(" "*25 + "ALL RECOMMENDATIONS")
             print("#"*80)
             
-            recommender.display_recommendations(
-                recommender.get_recommendations_by_genre(movie_id, 5), "Genre"
-            )
-            recommender.display_recommendations(
-                recommender.get_recommendations_by_director(movie_id, 5), "Director"
-            )
-            recommender.display_recommendations(
-                recommender.get_recommendations_by_cast(movie_id, 5), "Cast"
-            )
-            recommender.display_recommendations(
-                recommender.get_recommendations_by_keywords(movie_id, 5), "Plot Keywords"
-            )
-            recommender.display_recommendations(
-                recommender.get_recommendations_by_rating(movie_id, 5), "Rating"
-            )
-            recommender.display_recommendations(
-                recommender.get_tmdb_recommendations(movie_id, 5), "TMDB Algorithm"
-            )
+            for recommendations, criteria in recommender.get_all_recommendations(movie_id, 5):
+                recommender.display_recommendations(recommendations, criteria)
         elif choice == '8':
             movie_title = input("\nEnter a new movie title: ").strip()
             if movie_title:
@@ -352,7 +513,7 @@ def main():
                 movie = recommender.search_movie(movie_title)
                 if movie:
                     recommender.display_movie_info(movie)
-                    movie_id = movie['id']
+                    movie_id = movie.id
                 else:
                     print(f"Could not find movie: {movie_title}")
             else: